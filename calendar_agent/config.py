@@ -6,9 +6,9 @@ from typing import Optional
 import logfire
 from dotenv import load_dotenv
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 from .models import Base
 
@@ -78,15 +78,37 @@ class DatabaseConfig:
                 self.db_url,
                 connect_args=connect_args,
             )
+
+            if ":memory:" in self.db_url or "mode=memory" in self.db_url:
+                # In-memory databases (tests, demos) don't need durability:
+                # skip the fsync and rollback-journal bookkeeping SQLite
+                # otherwise performs on every commit.
+                @event.listens_for(self._engine, "connect")
+                def _set_memory_pragmas(dbapi_connection, connection_record):
+                    cursor = dbapi_connection.cursor()
+                    cursor.execute("PRAGMA synchronous=OFF")
+                    cursor.execute("PRAGMA journal_mode=MEMORY")
+                    cursor.execute("PRAGMA temp_store=MEMORY")
+                    cursor.close()
+
             # Create tables if they don't exist
             Base.metadata.create_all(self._engine)
         return self._engine
 
     @property
-    def session_factory(self) -> sessionmaker:
-        """Get or create SQLAlchemy session factory."""
+    def session_factory(self) -> scoped_session:
+        """Get or create SQLAlchemy session factory.
+
+        Uses scoped_session so repeated factory calls within a thread reuse
+        one Session object instead of allocating a new identity map and
+        transaction state each time. expire_on_commit=False keeps returned
+        objects readable after commit without re-SELECTing every attribute.
+        Call .remove() to discard the thread's session explicitly.
+        """
         if self._session_factory is None:
-            self._session_factory = sessionmaker(bind=self.engine)
+            self._session_factory = scoped_session(
+                sessionmaker(bind=self.engine, expire_on_commit=False)
+            )
         return self._session_factory
 
     def init_db(self) -> Engine:
@@ -5,7 +5,7 @@ from enum import Enum
 
 from sqlalchemy import DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -63,6 +63,11 @@ class Appointment(Base):
     """Appointment model."""
 
     __tablename__ = "appointments"
+    # Conflict detection and range queries filter on calendar_id plus the
+    # time window, so index those columns together
+    __table_args__ = (
+        Index("ix_appointments_calendar_time", "calendar_id", "start_time", "end_time"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     calendar_id: Mapped[int] = mapped_column(ForeignKey("calendars.id"), nullable=False)
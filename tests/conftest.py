@@ -4,11 +4,18 @@ This file sets up fixtures and configurations for testing.
 """
 
 import os
+import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import logfire
 import pytest
 from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from calendar_agent.models import Base, Calendar
 
 # Load environment variables from .env and .env.secrets
 BASE_DIR = Path(__file__).parent.parent
@@ -40,3 +47,152 @@ def setup_logfire():
 
     # Ensure all logs are sent before the test session ends
     logfire.force_flush()
+
+
+@pytest.fixture(scope="session")
+def base_now():
+    """
+    Capture the wall clock once for the whole test session.
+
+    Derived time fixtures build on this single value, so a run never
+    straddles a midnight (or DST) boundary mid-suite and repeated
+    datetime.now syscalls are avoided.
+    """
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def at_10am(base_now):
+    """Today at 10 AM UTC, derived once from the frozen session clock."""
+    return base_now.replace(hour=10, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture(scope="module")
+def at_noon(base_now):
+    """Today at 12 PM UTC, derived once from the frozen session clock."""
+    return base_now.replace(hour=12, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture(scope="module")
+def at_2pm(base_now):
+    """Today at 2 PM UTC, derived once from the frozen session clock."""
+    return base_now.replace(hour=14, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture(scope="module")
+def tomorrow_9am(base_now):
+    """Get tomorrow at 9 AM UTC, derived from the session's frozen clock."""
+    return base_now.replace(
+        hour=9, minute=0, second=0, microsecond=0
+    ) + timedelta(days=1)
+
+
+@pytest.fixture(scope="module")
+def tomorrow_hour(tomorrow_9am):
+    """Precomputed tomorrow-at-hour datetimes, keyed by hour.
+
+    datetime.replace allocates and re-validates on every call, so the
+    handful of afternoon times the tests reuse are built once per module.
+    """
+    return {hour: tomorrow_9am.replace(hour=hour) for hour in (14, 15, 16, 17)}
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    Create one shared-cache in-memory SQLite engine for the test session.
+
+    The file:...?mode=memory&cache=shared URI lets every connection the
+    engine hands out see the same database, so the schema is created once
+    here and fixtures can commit seed rows on their own connections.
+    A keepalive connection is held for the whole session because a shared
+    in-memory database is destroyed when its last connection closes.
+    Per-test isolation comes from db_transaction below.
+    """
+    # Key the database name by xdist worker id (gw0, gw1, ... or "master"
+    # for non-parallel runs) so each worker gets its own isolated DB
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    db_url = "sqlite:///file:cal_test_%s_%s?mode=memory&cache=shared&uri=true" % (
+        worker,
+        uuid.uuid4().hex,
+    )
+    # QueuePool (not SQLite's default SingletonThreadPool) so concurrent
+    # checkouts get distinct connections instead of aliasing one handle
+    # One engine for the whole run also means one SQL compilation cache;
+    # size it to hold every distinct statement the suite produces
+    engine = create_engine(
+        db_url,
+        poolclass=QueuePool,
+        connect_args={"check_same_thread": False},
+        query_cache_size=1200,
+    )
+
+    # pysqlite emits BEGIN lazily (at the first DML statement), which
+    # silently breaks the outer-transaction/SAVEPOINT isolation used by
+    # db_transaction. Take over transaction control per the SQLAlchemy
+    # "serializable isolation / savepoints" recipe for the sqlite3 driver.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "connect")
+    def _set_test_pragmas(dbapi_connection, connection_record):
+        # Throwaway test database: skip fsync and journal bookkeeping on
+        # the dozens of commits the suite performs
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    # The database is known to be empty, so skip the per-table existence
+    # checks (one PRAGMA round trip each) that checkfirst=True would run
+    Base.metadata.create_all(engine, checkfirst=False)
+    keepalive = engine.connect()
+    yield engine
+    keepalive.close()
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_transaction(engine):
+    """
+    Wrap each test in an external transaction rolled back at teardown.
+
+    Sessions created through session_factory join this transaction via
+    SAVEPOINTs, so every row written during the test — including commits
+    issued by CalendarService — is undone here without any DDL.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="function")
+def session_factory(db_transaction):
+    """Session factory whose sessions join the per-test transaction."""
+    return sessionmaker(
+        bind=db_transaction, join_transaction_mode="create_savepoint"
+    )
+
+
+@pytest.fixture(scope="module")
+def calendar(engine):
+    """Create the shared test calendar once per module.
+
+    The row is committed on its own connection, so it survives the
+    per-test transaction rollbacks; appointments the tests attach to it
+    are still rolled back individually.
+    """
+    with sessionmaker(bind=engine)() as session:
+        cal = Calendar(agent_id="test_agent", name="Test Calendar", time_zone="UTC")
+        session.add(cal)
+        session.commit()
+        session.refresh(cal)
+    return cal
@@ -1,15 +1,12 @@
 """Tests for the calendar service."""
 
-import os
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
 
 from calendar_agent.calendar_service import CalendarService
-from calendar_agent.config import DatabaseConfig
-from calendar_agent.models import Appointment, AppointmentStatus, Base, Calendar
+from calendar_agent.models import Appointment, AppointmentStatus
 
 
 def utc_datetime(*args, **kwargs) -> datetime:
@@ -17,35 +14,56 @@ def utc_datetime(*args, **kwargs) -> datetime:
     return datetime(*args, **kwargs, tzinfo=timezone.utc)
 
 
-@pytest.fixture(scope="function")
-def db_config():
-    """Create a new database config for each test."""
-    return DatabaseConfig("sqlite:///:memory:")
-
-
-@pytest.fixture(scope="function")
-def session_factory(db_config):
-    """Create a new session factory for each test."""
-    return db_config.session_factory
+# Module-local aliases: these enum members are referenced many times per
+# test run, so bind them once instead of repeating the attribute lookup
+_TENTATIVE = AppointmentStatus.TENTATIVE
+_CONFIRMED = AppointmentStatus.CONFIRMED
+_CANCELLED = AppointmentStatus.CANCELLED
+
+
+def _seed_confirmed(service, calendar_id, specs):
+    """Seed CONFIRMED appointments with a single executemany INSERT.
+
+    Bypasses schedule_appointment's conflict-detection path; use only for
+    fixture data that is known not to conflict, so the behaviour under
+    test still goes through the service API.
+
+    Args:
+        service: The calendar service whose session factory to use
+        calendar_id: ID of the calendar to attach the appointments to
+        specs: Iterable of (title, start_time, end_time, priority) tuples
+    """
+    rows = [
+        {
+            "calendar_id": calendar_id,
+            "title": title,
+            "start_time": start_time,
+            "end_time": end_time,
+            "status": _CONFIRMED,
+            "priority": priority,
+        }
+        for title, start_time, end_time, priority in specs
+    ]
+    with service.session_factory() as session:
+        session.execute(insert(Appointment), rows)
+        session.commit()
 
 
 @pytest.fixture(scope="function")
 def service(session_factory):
-    """Create a new calendar service for each test."""
+    """Create a calendar service bound to the per-test session factory."""
     return CalendarService(session_factory)
 
 
 @pytest.fixture(scope="function")
-def calendar(service):
-    """Create a test calendar."""
-    return service.create_calendar("test_agent", "Test Calendar", "UTC")
+def verify_session(session_factory):
+    """One session reused by all of a test's verification reads.
 
-
-@pytest.fixture(scope="function")
-def tomorrow_9am():
-    """Get tomorrow at 9 AM UTC."""
-    now = datetime.now(timezone.utc)
-    return now.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    Saves re-entering service.session_factory() (session construction,
+    connection checkout, transaction begin) once per assertion block.
+    """
+    with session_factory() as session:
+        yield session
 
 
 def test_create_calendar(service):
@@ -56,106 +74,112 @@ def test_create_calendar(service):
     assert calendar.time_zone == "America/Los_Angeles"
 
 
-def test_schedule_confirmed_appointment(service, calendar, tomorrow_9am):
-    """Test scheduling a confirmed appointment."""
-    success, apt, _ = service.schedule_appointment(
-        calendar.id,
-        "Morning Meeting",
-        tomorrow_9am,
-        tomorrow_9am + timedelta(hours=1),
-        AppointmentStatus.CONFIRMED,
-        priority=3,
-    )
-    assert success
-    assert apt.title == "Morning Meeting"
-    assert apt.status == AppointmentStatus.CONFIRMED
-    assert apt.priority == 3
-    # Check time values without relying on timezone
-    # SQLite doesn't store timezone info, so we just check the time components
-    assert apt.start_time.hour == tomorrow_9am.hour
-    assert apt.start_time.minute == tomorrow_9am.minute
-    end_time = tomorrow_9am + timedelta(hours=1)
-    assert apt.end_time.hour == end_time.hour
-    assert apt.end_time.minute == end_time.minute
-
-
-def test_schedule_conflicting_confirmed_appointments(service, calendar, tomorrow_9am):
-    """Test that we can't schedule conflicting confirmed appointments without proper conflict resolution."""
-    # Schedule first appointment
-    success1, apt1, _ = service.schedule_appointment(
-        calendar.id,
-        "First Meeting",
-        tomorrow_9am,
-        tomorrow_9am + timedelta(hours=1),
-        AppointmentStatus.CONFIRMED,
-        priority=3,
-    )
-    assert success1
-
-    # Try to schedule conflicting appointment
-    success2, apt2, conflicts = service.schedule_appointment(
-        calendar.id,
-        "Conflicting Meeting",
-        tomorrow_9am + timedelta(minutes=30),
-        tomorrow_9am + timedelta(hours=1, minutes=30),
-        AppointmentStatus.CONFIRMED,
-        priority=1,  # Higher priority can override CONFIRMED in our enhanced implementation
-    )
-
-    # With our enhanced implementation, this should succeed but return conflicts
-    assert success2
-    assert apt2 is not None
-    assert len(conflicts) == 1
-    assert conflicts[0].id == apt1.id
-
-    # Verify that the conflicting appointment was created
-    with service.session_factory() as session:
-        created_apt = (
-            session.query(Appointment).filter(Appointment.id == apt2.id).first()
-        )
-        assert created_apt is not None
-        assert created_apt.status == AppointmentStatus.CONFIRMED
-
-
-def test_high_priority_overrides_low_priority_tentative(
-    service, calendar, tomorrow_9am
+# (title, start offset, end offset, status, priority) specs for the
+# shared schedule-then-assert test below
+@pytest.mark.parametrize(
+    "first, second, expect_conflict, first_status_after",
+    [
+        pytest.param(
+            None,
+            ("Morning Meeting", timedelta(), timedelta(hours=1), _CONFIRMED, 3),
+            False,
+            None,
+            id="single-confirmed",
+        ),
+        pytest.param(
+            ("First Meeting", timedelta(), timedelta(hours=1), _CONFIRMED, 3),
+            (
+                "Conflicting Meeting",
+                timedelta(minutes=30),
+                timedelta(hours=1, minutes=30),
+                _CONFIRMED,
+                1,  # higher priority can override CONFIRMED in our enhanced implementation
+            ),
+            True,
+            None,
+            id="confirmed-overridden",
+        ),
+        pytest.param(
+            ("Low Priority Meeting", timedelta(), timedelta(hours=1), _TENTATIVE, 5),
+            ("High Priority Meeting", timedelta(), timedelta(hours=1), _CONFIRMED, 1),
+            True,
+            [_CANCELLED, _TENTATIVE],
+            id="tentative-overridden",
+        ),
+    ],
+)
+def test_scheduling_conflict(
+    service,
+    calendar,
+    tomorrow_9am,
+    verify_session,
+    first,
+    second,
+    expect_conflict,
+    first_status_after,
 ):
-    """Test that high priority appointments override low priority tentative ones."""
-    # Schedule low priority tentative appointment
-    success1, apt1, _ = service.schedule_appointment(
-        calendar.id,
-        "Low Priority Meeting",
-        tomorrow_9am,
-        tomorrow_9am + timedelta(hours=1),
-        AppointmentStatus.TENTATIVE,
-        priority=5,
-    )
-    assert success1
+    """Schedule one (optionally conflicting) appointment and check the outcome.
+
+    Covers the plain-confirmed, confirmed-vs-confirmed and
+    high-priority-vs-tentative cases over one shared calendar fixture.
+    """
+    apt1 = None
+    if first is not None:
+        title, start, end, status, priority = first
+        success1, apt1, _ = service.schedule_appointment(
+            calendar.id,
+            title,
+            tomorrow_9am + start,
+            tomorrow_9am + end,
+            status,
+            priority=priority,
+        )
+        assert success1
 
-    # Schedule high priority appointment at same time
+    title, start, end, status, priority = second
     success2, apt2, conflicts = service.schedule_appointment(
         calendar.id,
-        "High Priority Meeting",
-        tomorrow_9am,
-        tomorrow_9am + timedelta(hours=1),
-        AppointmentStatus.CONFIRMED,
-        priority=1,
+        title,
+        tomorrow_9am + start,
+        tomorrow_9am + end,
+        status,
+        priority=priority,
     )
 
-    # Should succeed and have the conflict
+    # With our enhanced implementation scheduling succeeds either way;
+    # a conflicting booking is reported rather than rejected
     assert success2
     assert apt2 is not None
-    assert len(conflicts) == 1
-    assert conflicts[0].id == apt1.id
-
-    with service.session_factory() as session:
-        original_apt = (
-            session.query(Appointment).filter(Appointment.id == apt1.id).first()
-        )
-        assert original_apt.status in [
-            AppointmentStatus.CANCELLED,
-            AppointmentStatus.TENTATIVE,
-        ]
+    assert apt2.title == title
+    assert apt2.priority == priority
+    if expect_conflict:
+        assert len(conflicts) == 1
+        assert conflicts[0].id == apt1.id
+    else:
+        assert conflicts is None or len(conflicts) == 0
+        # Check time values without relying on timezone
+        # SQLite doesn't store timezone info, so we just check the time components
+        assert apt2.start_time.hour == (tomorrow_9am + start).hour
+        assert apt2.start_time.minute == (tomorrow_9am + start).minute
+        assert apt2.end_time.hour == (tomorrow_9am + end).hour
+        assert apt2.end_time.minute == (tomorrow_9am + end).minute
+
+    # Verify the new appointment was persisted: re-attach the ORM
+    # reference and refresh just its status column (one PK-indexed
+    # single-column SELECT instead of a full re-query)
+    verify_session.add(apt2)
+    verify_session.refresh(apt2, ["status"])
+    assert apt2.status == status
+
+    if first_status_after is not None:
+        # Read-only verification: skip the autoflush dirty-set scan
+        with verify_session.no_autoflush:
+            original_status = (
+                verify_session.query(Appointment.status)
+                .filter(Appointment.id == apt1.id)
+                .scalar()
+            )
+            assert original_status in first_status_after
 
 
 def test_check_availability(service, calendar, tomorrow_9am):
@@ -174,7 +198,7 @@ def test_check_availability(service, calendar, tomorrow_9am):
         "Meeting",
         tomorrow_9am,
         tomorrow_9am + timedelta(hours=1),
-        AppointmentStatus.CONFIRMED,
+        _CONFIRMED,
     )
 
     # Now should be unavailable
@@ -186,30 +210,24 @@ def test_check_availability(service, calendar, tomorrow_9am):
     )
 
 
-def test_find_available_slots(service, calendar, tomorrow_9am):
+def test_find_available_slots(service, calendar, tomorrow_9am, tomorrow_hour):
     """Test finding available time slots."""
-    # Schedule some appointments
-    service.schedule_appointment(
+    # Seed the morning and afternoon meetings in one batched INSERT;
+    # find_available_slots is what's under test here
+    _seed_confirmed(
+        service,
         calendar.id,
-        "Morning Meeting",
-        tomorrow_9am,
-        tomorrow_9am + timedelta(hours=1),
-        AppointmentStatus.CONFIRMED,
-    )
-
-    service.schedule_appointment(
-        calendar.id,
-        "Afternoon Meeting",
-        tomorrow_9am.replace(hour=14),
-        tomorrow_9am.replace(hour=15),
-        AppointmentStatus.CONFIRMED,
+        [
+            ("Morning Meeting", tomorrow_9am, tomorrow_9am + timedelta(hours=1), 3),
+            ("Afternoon Meeting", tomorrow_hour[14], tomorrow_hour[15], 3),
+        ],
     )
 
     # Find 30-minute slots between 9 AM and 5 PM
     slots = service.find_available_slots(
         calendar.id,
         tomorrow_9am,
-        tomorrow_9am.replace(hour=17),
+        tomorrow_hour[17],
         duration=30,
         priority=5,
     )
@@ -218,35 +236,30 @@ def test_find_available_slots(service, calendar, tomorrow_9am):
     assert len(slots) > 0
     # First slot should be after morning meeting
     assert slots[0][0] >= tomorrow_9am + timedelta(hours=1)
-    # All slots should be 30 minutes and timezone-aware
-    for start, end in slots:
-        assert end - start == timedelta(minutes=30)
-        assert start.tzinfo is not None
-        assert end.tzinfo is not None
+    # All slots should be 30 minutes and timezone-aware; one bulk
+    # assertion per property instead of three asserts per slot
+    thirty_minutes = timedelta(minutes=30)
+    assert all(end - start == thirty_minutes for start, end in slots)
+    assert all(
+        start.tzinfo is not None and end.tzinfo is not None for start, end in slots
+    )
 
 
-def test_is_day_underutilized(service, calendar, tomorrow_9am):
+def test_is_day_underutilized(service, calendar, tomorrow_9am, tomorrow_hour):
     """Test checking if a day is underutilized."""
     # Initially should be underutilized
     is_under, hours = service.is_day_underutilized(calendar.id, tomorrow_9am)
     assert is_under
     assert hours == 0
 
-    # Add some appointments
-    service.schedule_appointment(
-        calendar.id,
-        "Morning Meeting",
-        tomorrow_9am,
-        tomorrow_9am + timedelta(hours=2),
-        AppointmentStatus.CONFIRMED,
-    )
-
-    service.schedule_appointment(
+    # Add some appointments (batched; is_day_underutilized is under test)
+    _seed_confirmed(
+        service,
         calendar.id,
-        "Afternoon Meeting",
-        tomorrow_9am.replace(hour=14),
-        tomorrow_9am.replace(hour=16),
-        AppointmentStatus.CONFIRMED,
+        [
+            ("Morning Meeting", tomorrow_9am, tomorrow_9am + timedelta(hours=2), 3),
+            ("Afternoon Meeting", tomorrow_hour[14], tomorrow_hour[16], 3),
+        ],
     )
 
     # Now should not be underutilized (4 hours of meetings)
@@ -255,7 +268,7 @@ def test_is_day_underutilized(service, calendar, tomorrow_9am):
     assert hours == 4.0
 
 
-def test_cancel_appointment(service, calendar):
+def test_cancel_appointment(service, calendar, verify_session):
     """Test cancelling an appointment."""
     # First schedule an appointment
     start_time = datetime(2025, 2, 26, 14, 0, tzinfo=timezone.utc)  # 2 PM
@@ -265,7 +278,7 @@ def test_cancel_appointment(service, calendar):
         title="Test Appointment",
         start_time=start_time,
         end_time=end_time,
-        status=AppointmentStatus.CONFIRMED,
+        status=_CONFIRMED,
     )
     assert success
     assert appointment is not None
@@ -274,33 +287,31 @@ def test_cancel_appointment(service, calendar):
     success = service.cancel_appointment(calendar.id, appointment.id)
     assert success
 
-    # Verify the appointment is cancelled
-    with service.session_factory() as session:
-        cancelled_apt = (
-            session.query(Appointment).filter(Appointment.id == appointment.id).first()
-        )
-        assert cancelled_apt.status == AppointmentStatus.CANCELLED
+    # Verify the appointment is cancelled by refreshing just the status
+    # column on the reference we already hold
+    verify_session.add(appointment)
+    verify_session.refresh(appointment, ["status"])
+    assert appointment.status == _CANCELLED
 
 
 def test_get_appointments_in_range(service, calendar):
     """Test getting appointments in a time range."""
-    # Schedule some appointments
+    # Seed 3 one-hour appointments starting at 2 PM, 3 PM, and 4 PM
+    # in a single batched INSERT
     base_time = datetime(2025, 2, 26, 14, 0, tzinfo=timezone.utc)  # 2 PM
-    appointments = []
-
-    # Create 3 one-hour appointments starting at 2 PM, 3 PM, and 4 PM
-    for i in range(3):
-        start_time = base_time + timedelta(hours=i)
-        end_time = start_time + timedelta(hours=1)
-        success, apt, _ = service.schedule_appointment(
-            calendar_id=calendar.id,
-            title=f"Appointment {i+1}",
-            start_time=start_time,
-            end_time=end_time,
-            status=AppointmentStatus.CONFIRMED,
-        )
-        assert success
-        appointments.append(apt)
+    _seed_confirmed(
+        service,
+        calendar.id,
+        [
+            (
+                f"Appointment {i+1}",
+                base_time + timedelta(hours=i),
+                base_time + timedelta(hours=i + 1),
+                3,
+            )
+            for i in range(3)
+        ],
+    )
 
     # Test getting appointments in various ranges
     # 1. Get all appointments (2 PM to 5 PM)
@@ -334,17 +345,19 @@ def test_get_appointments_in_range(service, calendar):
     assert len(no_apts) == 0
 
 
-def test_priority_conflict_resolution(service, calendar, tomorrow_9am):
+def test_priority_conflict_resolution(
+    service, calendar, tomorrow_9am, tomorrow_hour, verify_session
+):
     """Test handling conflicts based on priority using update_appointment."""
     # Schedule a low priority appointment
-    apt_tour_start = tomorrow_9am.replace(hour=14)
+    apt_tour_start = tomorrow_hour[14]
     apt_tour_end = apt_tour_start + timedelta(hours=1)
     success1, apt_tour, _ = service.schedule_appointment(
         calendar_id=calendar.id,
         title="Apartment Tour",
         start_time=apt_tour_start,
         end_time=apt_tour_end,
-        status=AppointmentStatus.CONFIRMED,
+        status=_CONFIRMED,
         priority=4,  # Lower priority
     )
     assert success1
@@ -357,7 +370,7 @@ def test_priority_conflict_resolution(service, calendar, tomorrow_9am):
         title="Client Meeting",
         start_time=client_meeting_start,
         end_time=client_meeting_end,
-        status=AppointmentStatus.TENTATIVE,  # Make it tentative to avoid auto-override
+        status=_TENTATIVE,  # Make it tentative to avoid auto-override
         priority=1,  # Higher priority
     )
     assert success2
@@ -369,35 +382,31 @@ def test_priority_conflict_resolution(service, calendar, tomorrow_9am):
     service.update_appointment(
         calendar_id=calendar.id,
         appointment_id=apt_tour.id,
-        status=AppointmentStatus.CANCELLED,
+        status=_CANCELLED,
     )
 
     # 2. Confirm the higher priority appointment
     service.update_appointment(
         calendar_id=calendar.id,
         appointment_id=client_meeting.id,
-        status=AppointmentStatus.CONFIRMED,
+        status=_CONFIRMED,
     )
 
-    # Verify the changes were applied
-    with service.session_factory() as session:
-        # Check that the apartment tour is cancelled
-        apt_tour_updated = (
-            session.query(Appointment).filter(Appointment.id == apt_tour.id).first()
-        )
-        assert apt_tour_updated.status == AppointmentStatus.CANCELLED
-
-        # Check that the client meeting is confirmed
-        client_meeting_updated = (
-            session.query(Appointment)
-            .filter(Appointment.id == client_meeting.id)
-            .first()
+    # Verify the changes were applied: fetch both statuses in one query
+    # instead of one session/SELECT per appointment
+    with verify_session.no_autoflush:
+        statuses = dict(
+            verify_session.query(Appointment.id, Appointment.status)
+            .filter(Appointment.id.in_([apt_tour.id, client_meeting.id]))
+            .all()
         )
-        assert client_meeting_updated.status == AppointmentStatus.CONFIRMED
+    # The apartment tour is cancelled; the client meeting is confirmed
+    assert statuses[apt_tour.id] == _CANCELLED
+    assert statuses[client_meeting.id] == _CONFIRMED
 
     # Alternative approach: Reschedule the lower priority appointment
     # Find a new time slot for the apartment tour
-    rescheduled_start = tomorrow_9am.replace(hour=16)  # 4pm
+    rescheduled_start = tomorrow_hour[16]  # 4pm
     rescheduled_end = rescheduled_start + timedelta(hours=1)
 
     # Check if the new time slot is available
@@ -412,122 +421,15 @@ def test_priority_conflict_resolution(service, calendar, tomorrow_9am):
             appointment_id=apt_tour.id,
             start_time=rescheduled_start,
             end_time=rescheduled_end,
-            status=AppointmentStatus.CONFIRMED,
+            status=_CONFIRMED,
         )
 
         # Verify the rescheduling
-        with service.session_factory() as session:
-            rescheduled_apt = (
-                session.query(Appointment).filter(Appointment.id == apt_tour.id).first()
+        with verify_session.no_autoflush:
+            rescheduled_start, rescheduled_status = (
+                verify_session.query(Appointment.start_time, Appointment.status)
+                .filter(Appointment.id == apt_tour.id)
+                .one()
             )
-            assert rescheduled_apt.start_time.hour == 16
-            assert rescheduled_apt.status == AppointmentStatus.CONFIRMED
-
-
-def test_is_day_underutilized(service, calendar, tomorrow_9am):
-    """Test checking if a day is underutilized."""
-    # Initially should be underutilized
-    is_under, hours = service.is_day_underutilized(calendar.id, tomorrow_9am)
-    assert is_under
-    assert hours == 0
-
-    # Add some appointments
-    service.schedule_appointment(
-        calendar.id,
-        "Morning Meeting",
-        tomorrow_9am,
-        tomorrow_9am + timedelta(hours=2),
-        AppointmentStatus.CONFIRMED,
-    )
-
-    service.schedule_appointment(
-        calendar.id,
-        "Afternoon Meeting",
-        tomorrow_9am.replace(hour=14),
-        tomorrow_9am.replace(hour=16),
-        AppointmentStatus.CONFIRMED,
-    )
-
-    # Now should not be underutilized (4 hours of meetings)
-    is_under, hours = service.is_day_underutilized(calendar.id, tomorrow_9am)
-    assert not is_under
-    assert hours == 4.0
-
-
-def test_cancel_appointment(service, calendar):
-    """Test cancelling an appointment."""
-    # First schedule an appointment
-    start_time = datetime(2025, 2, 26, 14, 0, tzinfo=timezone.utc)  # 2 PM
-    end_time = start_time + timedelta(hours=1)
-    success, appointment, _ = service.schedule_appointment(
-        calendar_id=calendar.id,
-        title="Test Appointment",
-        start_time=start_time,
-        end_time=end_time,
-        status=AppointmentStatus.CONFIRMED,
-    )
-    assert success
-    assert appointment is not None
-
-    # Cancel the appointment
-    success = service.cancel_appointment(calendar.id, appointment.id)
-    assert success
-
-    # Verify the appointment is cancelled
-    with service.session_factory() as session:
-        cancelled_apt = (
-            session.query(Appointment).filter(Appointment.id == appointment.id).first()
-        )
-        assert cancelled_apt.status == AppointmentStatus.CANCELLED
-
-
-def test_get_appointments_in_range(service, calendar):
-    """Test getting appointments in a time range."""
-    # Schedule some appointments
-    base_time = datetime(2025, 2, 26, 14, 0, tzinfo=timezone.utc)  # 2 PM
-    appointments = []
-
-    # Create 3 one-hour appointments starting at 2 PM, 3 PM, and 4 PM
-    for i in range(3):
-        start_time = base_time + timedelta(hours=i)
-        end_time = start_time + timedelta(hours=1)
-        success, apt, _ = service.schedule_appointment(
-            calendar_id=calendar.id,
-            title=f"Appointment {i+1}",
-            start_time=start_time,
-            end_time=end_time,
-            status=AppointmentStatus.CONFIRMED,
-        )
-        assert success
-        appointments.append(apt)
-
-    # Test getting appointments in various ranges
-    # 1. Get all appointments (2 PM to 5 PM)
-    success, all_apts = service.get_appointments_in_range(
-        calendar_id=calendar.id,
-        start_time=base_time,
-        end_time=base_time + timedelta(hours=3),
-    )
-    assert success
-    assert len(all_apts) == 3
-    assert all(a.title in [f"Appointment {i+1}" for i in range(3)] for a in all_apts)
-
-    # 2. Get appointments in middle (2:30 PM to 3:30 PM)
-    success, middle_apts = service.get_appointments_in_range(
-        calendar_id=calendar.id,
-        start_time=base_time + timedelta(minutes=30),
-        end_time=base_time + timedelta(minutes=90),
-    )
-    assert success
-    assert len(middle_apts) == 2  # Should include first and second appointments
-    assert middle_apts[0].title == "Appointment 1"
-    assert middle_apts[1].title == "Appointment 2"
-
-    # 3. Get appointments with no overlap
-    success, no_apts = service.get_appointments_in_range(
-        calendar_id=calendar.id,
-        start_time=base_time + timedelta(hours=5),  # 7 PM
-        end_time=base_time + timedelta(hours=6),  # 8 PM
-    )
-    assert success
-    assert len(no_apts) == 0
+            assert rescheduled_start.hour == 16
+            assert rescheduled_status == _CONFIRMED
@@ -1,31 +1,35 @@
 import os
 
-import logfire
 import pytest
 
 from calendar_agent.config import config
 
 
-def test_logfire_configuration():
+def test_logfire_configuration(capfire):
     """Test that Logfire is properly configured during pytest execution."""
-    # Check if Logfire is configured
-    print("Logfire configuration:")
-    print(f"LOGFIRE_CONSOLE_LOG: {os.environ.get('LOGFIRE_CONSOLE_LOG')}")
-    print(
-        f"LOGFIRE_API_KEY: {'Set' if os.environ.get('LOGFIRE_API_KEY') else 'Not set'}"
-    )
-    print(f"LOGFIRE_DATASET: {os.environ.get('LOGFIRE_DATASET')}")
-
-    # Try to log something
+    # Imported lazily so collecting (or deselecting) this module doesn't
+    # pay the Logfire/OpenTelemetry SDK import cost up front
+    logfire = pytest.importorskip("logfire")
+
+    # Log through the captured exporter; nothing leaves the process
     logfire.info("test_message_from_pytest", test_value="This is a test")
 
+    spans = capfire.exporter.exported_spans_as_dict()
+    assert any(span["name"] == "test_message_from_pytest" for span in spans)
+
     # Check if config is properly initialized
     assert config is not None
     assert hasattr(config, "is_using_real_llm")
+    assert config.log_level
+
 
-    # Print config values
-    print(f"Config log_level: {config.log_level}")
-    print(f"Using real LLM: {config.is_using_real_llm}")
+@pytest.mark.skipif(
+    not os.environ.get("LOGFIRE_API_KEY"),
+    reason="real Logfire export requires LOGFIRE_API_KEY",
+)
+def test_logfire_cloud_export():
+    """Exercise a real export when Logfire credentials are available."""
+    logfire = pytest.importorskip("logfire")
 
-    # Test passes if we get here
-    assert True
+    logfire.info("test_cloud_message_from_pytest", test_value="This is a test")
+    logfire.force_flush()